@@ -1,6 +1,24 @@
-from setuptools import setup, find_namespace_packages
+from setuptools import setup, find_namespace_packages, Command
 import shutil
 import glob
+import os
+
+
+class CleanCommand(Command):
+    """Clean the build files (`python setup.py clean`)."""
+    description = 'remove the dist, build and egg-info directories'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        for path in ['dist', 'build'] + glob.glob('src/*.egg-info'):
+            if os.path.isdir(path):
+                shutil.rmtree(path)
 
 
 setup(name='py-drive-client',
@@ -13,15 +31,10 @@ setup(name='py-drive-client',
       description='App to manage files in Google drive from local console.',
       long_description=open('README.md').read(),
       entry_points={'console_scripts': ['py-drive-client=py_drive_client.py_drive_client:main']},
-      install_requires=["PyDrive==1.3.1"],
+      install_requires=["PyDrive==1.3.1", "google-api-python-client>=1.2"],
       package_dir={"": "src/"},
       packages=find_namespace_packages(where="src"),
       include_package_data=True,
       package_data={'py_drive_client': ['credentials/client_secrets.json']},
+      cmdclass={'clean': CleanCommand},
       zip_safe=False)
-
-
-# Clean build files
-shutil.rmtree('dist')
-shutil.rmtree('build')
-shutil.rmtree(glob.glob('src/*.egg-info')[0])
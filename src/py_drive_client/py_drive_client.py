@@ -21,13 +21,24 @@ Requirements:
       https://console.cloud.google.com/
 """
 import argparse
+import functools
 import logging
+import mimetypes
 import sys
 import os
-import shutil
+import random
+import stat
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from pydrive.drive import GoogleDrive
 from pydrive.auth import GoogleAuth
+from pydrive.files import ApiRequestError
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -35,6 +46,22 @@ CREDENTIALS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'cr
 DEFAULT_APP_CREDENTIALS_FILE = os.path.join(CREDENTIALS_PATH, 'client_secrets.json')
 DEFAULT_USER_CREDENTIALS_FILE = os.path.join(CREDENTIALS_PATH, 'credentials.json')
 LOGGER = logging.getLogger('py_drive')
+_LOG_HANDLER = logging.StreamHandler(sys.stdout)  # App logging handler (attached to the logger by _set_logging)
+_LOG_HANDLER.setFormatter(logging.Formatter("%(asctime)s — %(levelname)s — %(message)s"))
+_FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+_FILE_FIELDS = 'id,title,mimeType,parents(id,isRoot)'  # Only request the fields used by the app
+_LIST_FIELDS = f"items({_FILE_FIELDS}),nextPageToken"
+_MEDIA_CHUNK_SIZE = 16 * 1024 * 1024  # Size of each request of the resumable uploads and the downloads
+_MAX_QUERY_PARENTS = 50  # Maximum number of parent directories combined in a single listing query
+_RETRY_STATUSES = (429, 500, 502, 503, 504)  # HTTP status codes of the temporary Drive API errors
+# Google Drive query templates. The values must be quoted with _esc
+_Q_PARENT = '{parent} in parents'
+_Q_TITLE = 'title={title}'
+_Q_FOLDER = f"mimeType='{_FOLDER_MIME_TYPE}'"
+_ROOT_DRIVE_OBJECT = {'id': 'root', 'title': '', 'mimeType': _FOLDER_MIME_TYPE}  # Root directory data
+# Resolved drive paths (without the initial /) and their Google Drive object data, per Drive authentication object
+_PATH_CACHES = weakref.WeakKeyDictionary()
+_PATH_CACHES_LOCK = threading.Lock()
 COLORS = {
     'GREEN': '\033[92m',
     'YELLOW': '\033[93m',
@@ -47,43 +74,95 @@ COLORS = {
 # ------------------------------------------  PRIVATE FUNCTIONS  -------------------------------------------------------
 
 
-def _error(message):
-    """Log an ERROR message with a custom color (RED).
+def _error(message, *args):
+    """Log an ERROR message with a custom color (RED). The message is only colored and formatted (%-style) with
+    the `args` values if it is going to be logged.
 
     Args:
         message (str): Logging message.
+        args: Values to format the logging message with.
     """
-    LOGGER.error(f"{COLORS['RED']}{message}{COLORS['END']}")
+    if LOGGER.isEnabledFor(logging.ERROR):
+        LOGGER.error(COLORS['RED'] + message + COLORS['END'], *args)
 
 
-def _info(message):
-    """Log an INFO message with a custom color (YELLOW).
+def _info(message, *args):
+    """Log an INFO message with a custom color (YELLOW). The message is only colored and formatted (%-style) with
+    the `args` values if it is going to be logged.
 
     Args:
         message (str): Logging message.
+        args: Values to format the logging message with.
     """
-    LOGGER.info(f"{COLORS['YELLOW']} {message}{COLORS['END']}")  # Empty space before the message to align with others
+    if LOGGER.isEnabledFor(logging.INFO):
+        # Empty space before the message to align with others
+        LOGGER.info(COLORS['YELLOW'] + ' ' + message + COLORS['END'], *args)
 
 
-def _debug(message):
-    """Log a DEBUG message with a custom color (CYAN).
+def _debug(message, *args):
+    """Log a DEBUG message with a custom color (CYAN). The message is only colored and formatted (%-style) with
+    the `args` values if it is going to be logged.
 
     Args:
         message (str): Logging message.
+        args: Values to format the logging message with.
     """
-    LOGGER.debug(f"{COLORS['CYAN']}{message}{COLORS['END']}")
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(COLORS['CYAN'] + message + COLORS['END'], *args)
+
+
+def _esc(value):
+    """Quote a value to be used in a Google Drive query, escaping its backslashes and single quotes.
+
+    Args:
+        value (str): Value to quote.
+
+    Returns:
+        str: Quoted value.
+    """
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _q_children_of(parent_id, title=None):
+    """Build the Google Drive query to get the (not trashed) content of a directory.
+
+    Args:
+        parent_id (str): Google Drive id of the directory ('root' for the root directory).
+        title (str): Get only the objects with this title. None to get all the directory content.
+
+    Returns:
+        str: Google Drive query.
+    """
+    query = _Q_PARENT.format(parent=_esc(parent_id))
+
+    if title is not None:
+        query = f"{query} and {_Q_TITLE.format(title=_esc(title))}"
+
+    return f"{query} and trashed=false"
+
+
+def _norm_path(path):
+    """Split a Google Drive path into its path names (levels), ignoring the initial and final /.
+
+    Args:
+        path (str): Google Drive path.
+
+    Returns:
+        tuple(str): Path names (levels) of the path. Empty if the path is the root directory.
+    """
+    path = path.strip('/')
+
+    return tuple(path.split('/')) if path else ()
 
 
 def _set_logging(debug):
-    """Define the app logger level and format.
+    """Define the app logger level and format. The same handler is reused on each call, so it is only attached once.
 
     Args:
         debug (boolean): True to set a DEBUG level, False to set a INFO level.
     """
     LOGGER.setLevel(logging.DEBUG if debug else logging.INFO)
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter("%(asctime)s — %(levelname)s — %(message)s"))
-    LOGGER.addHandler(handler)
+    LOGGER.addHandler(_LOG_HANDLER)
 
 
 def _check_credentials_file():
@@ -93,54 +172,56 @@ def _check_credentials_file():
         sys.exit(1)
 
 
-def _get_parameters():
-    """Get the user parameters when the app is run.
+def _positive_int(value):
+    """Convert a command line value to a positive integer (argparse type).
+
+    Args:
+        value (str): Command line value.
 
     Returns:
-        argparse.Namespace: User parameters.
+        int: Converted value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer greater than 0.
     """
-    arg_parser = argparse.ArgumentParser()
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
 
-    arg_parser.add_argument('-l', '--list', metavar=('<drive_path>'), type=str, required=False,
-                            help='List files from drive')
-    arg_parser.add_argument('-u', '--upload', metavar=('<local_source_path>', '<drive_destination_path>'),
-                            type=str, nargs=2, required=False, help='Upload a file or folder from local to drive')
-    arg_parser.add_argument('-d', '--download', metavar=('<drive_object_path>', '<local_destination_path>'),
-                            type=str, nargs=2, required=False, help='Download a file or folder from drive to local')
-    arg_parser.add_argument('-r', '--remove', metavar='<drive_path>', type=str, required=False,
-                            help='Remove a file or folder from drive')
-    arg_parser.add_argument('-v', '--debug', action='store_true', required=False, help='Activate debug logging')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive int value: '{value}'")
 
-    return arg_parser.parse_args()
+    return number
 
 
-def _validate_parameters(input_parameters):
-    """Check if the user parameters are correct. If not, the execution will be stopped.
+def _get_parameters():
+    """Get the user parameters when the app is run.
 
-    Args:
-        input_parameters (argparse.Namespace): User parameters.
+    Returns:
+        argparse.Namespace: User parameters.
     """
-    _debug(f"Validating input parameters: {input_parameters}")
-    parameters_value = [parameter for parameter in [input_parameters.upload, input_parameters.download,
-                                                    input_parameters.list, input_parameters.remove]
-                        if parameter is not None]
-
-    # Check that there is no two different actions in the same command
-    if len(parameters_value) > 1:
-        _error('Select just one of the following actions: --list, --upload, --download or --remove')
-        sys.exit(1)
-
-    # Check that a required parameter value has been specified
-    elif all(parameter is None for parameter in (input_parameters.upload, input_parameters.download,
-             input_parameters.remove, input_parameters.list)):
-        _error('Select one of the following actions: --list, --upload, --download or --remove')
-        sys.exit(1)
+    arg_parser = argparse.ArgumentParser()
+    # Exactly one action has to be selected
+    action_group = arg_parser.add_mutually_exclusive_group(required=True)
+
+    action_group.add_argument('-l', '--list', metavar=('<drive_path>'), type=str, help='List files from drive')
+    action_group.add_argument('-u', '--upload', metavar=('<local_source_path>', '<drive_destination_path>'),
+                              type=str, nargs=2, help='Upload a file or folder from local to drive')
+    action_group.add_argument('-d', '--download', metavar=('<drive_object_path>', '<local_destination_path>'),
+                              type=str, nargs=2, help='Download a file or folder from drive to local')
+    action_group.add_argument('-r', '--remove', metavar='<drive_path>', type=str,
+                              help='Remove a file or folder from drive')
+    arg_parser.add_argument('-p', '--parallel', metavar='<workers>', type=_positive_int, default=8, required=False,
+                            help='Maximum number of files to upload or download at the same time (default: 8)')
+    arg_parser.add_argument('-v', '--debug', action='store_true', required=False, help='Activate debug logging')
 
-    _debug('Parameters have been successfully validated')
+    return arg_parser.parse_args()
 
 
+@functools.lru_cache(maxsize=1)
 def _drive_authentication(credentials_file=DEFAULT_USER_CREDENTIALS_FILE):
-    """Get drive authentication using a credentials file.
+    """Get drive authentication using a credentials file. The authentication is only made once per process.
 
     This process will load and validate the credentials file. If the credentials file does not exist or has expired,
     then a browser window will open to authenticate. After doing so, the credentials file will be generated.
@@ -179,11 +260,48 @@ def _drive_authentication(credentials_file=DEFAULT_USER_CREDENTIALS_FILE):
     else:
         google_auth.Authorize()
 
+    _share_http_connections(google_auth)
     _debug('Successfully authenticated')
 
     return google_auth
 
 
+def _share_http_connections(google_auth):
+    """Make the Google Drive requests reuse one authorized HTTP object (and its keep-alive connection) per thread.
+
+    By default, PyDrive creates and authorizes a new HTTP object for every request, so each request opens a new TLS
+    connection. HTTP objects are not thread-safe, so one is kept for each thread.
+
+    Args:
+        google_auth (pydrive.auth.GoogleAuth): Drive authentication object.
+    """
+    thread_data = threading.local()
+    create_http_object = google_auth.Get_Http_Object
+
+    def get_http_object():
+        if not hasattr(thread_data, 'http'):
+            thread_data.http = create_http_object()
+
+        return thread_data.http
+
+    google_auth.Get_Http_Object = get_http_object
+
+
+def _get_drive_service(drive):
+    """Get the Drive API service of a Google Drive instance, building it if it has not been built yet.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+
+    Returns:
+        googleapiclient.discovery.Resource: Drive API service.
+    """
+    if drive.auth.service is None:
+        drive.auth.Authorize()
+
+    return drive.auth.service
+
+
 def _is_drive_dir(object_data):
     """Check if the object is a Google Drive directory.
 
@@ -193,7 +311,80 @@ def _is_drive_dir(object_data):
     Returns:
         boolean: True if the object is a directory, False otherwise.
     """
-    return object_data['mimeType'] == 'application/vnd.google-apps.folder'
+    return object_data['mimeType'] == _FOLDER_MIME_TYPE
+
+
+def _get_drive_path_candidates(drive, path_names):
+    """Get, with a single request, all the Google Drive objects whose title matches any of the path names, so that
+    the path can be rebuilt locally by chaining each object with its parent directory.
+
+    The query is not scoped to any directory, so it can match many objects when the path names are common. Only the
+    first page of results is requested: if there are more, then no candidates are returned, and the path has to be
+    walked level by level.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        path_names (list(str)): Path names (levels) to get.
+
+    Returns:
+        dict: Google Drive objects list indexed by (parent_id, title), or None if there are too many candidates.
+              Objects located in the root directory are also indexed with the 'root' alias as parent id.
+    """
+    _debug("Getting the candidates of %s path names", path_names)
+    titles_query = ' or '.join(_Q_TITLE.format(title=_esc(path_name)) for path_name in sorted(set(path_names)))
+    file_list = drive.ListFile({'q': f"({titles_query}) and trashed=false", 'fields': _LIST_FIELDS,
+                                'maxResults': 1000})
+    items = _retry(next, file_list, [])
+
+    if file_list.get('pageToken') is not None:
+        _debug('Too many candidates for %s path names, walking the path level by level', path_names)
+        return None
+
+    candidates = {}
+
+    for item in items:
+        # Objects shared with the user may have no parents (they are not located in any directory of the user)
+        for parent in item.get('parents', []):
+            candidates.setdefault((parent['id'], item['title']), []).append(item)
+            if parent.get('isRoot'):
+                candidates.setdefault(('root', item['title']), []).append(item)
+
+    return candidates
+
+
+def _get_path_cache(drive):
+    """Get the paths cache of a Google Drive instance. The cache is shared by all the instances that use the same
+    authentication object, so the resolved paths of an account are never used with another one.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+
+    Returns:
+        dict: Google Drive object data indexed by its path (without the initial /).
+    """
+    with _PATH_CACHES_LOCK:
+        return _PATH_CACHES.setdefault(drive.auth, {})
+
+
+def _get_longest_cached_prefix(drive, tree):
+    """Get the deepest parent directory of a path that is already in the paths cache.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        tree (tuple(str)): Path names (levels) of the Google Drive path (without the initial /).
+
+    Returns:
+        tuple(int, str): Number of path levels of the cached parent directory (0 if none) and its id ('root' if none).
+    """
+    path_cache = _get_path_cache(drive)
+
+    for level in range(len(tree) - 1, 0, -1):
+        drive_object = path_cache.get('/'.join(tree[:level]))
+
+        if drive_object is not None:
+            return level, drive_object['id']
+
+    return 0, 'root'
 
 
 def _get_drive_object(drive, path):
@@ -207,48 +398,65 @@ def _get_drive_object(drive, path):
     Returns:
         list(GoogleDriveFile): List with object information (1 item if path is not /)
     """
-    _debug(f"Getting file info for '{path}'")
-    path = path[1:] if path and path[0] == '/' else path  # Clean initial /
-    tree = path.split('/')
+    _debug("Getting file info for '%s'", path)
+    tree = _norm_path(path)
+    path = '/'.join(tree)
     drive_objects = []
 
     # If queried about root path, then return root data
     if path == '':
         _debug('Single path detected (root)')
-        drive_objects = drive.ListFile({'q': "'root' in parents and trashed=false"}).GetList()
+        drive_objects = _list_drive_objects(drive, _q_children_of('root'))
+    # If the path has already been resolved, then return the cached data
+    elif path in _get_path_cache(drive):
+        _debug("Cached path detected (%s)", path)
+        drive_objects = [_get_path_cache(drive)[path]]
     # If path level is greater than 0, then walk through the directories structure
     else:
-        _debug(f"Compound path detected ({path})")
-        for level, path_name in enumerate(tree):
-            if level == 0:
-                drive_objects = drive.ListFile({'q': f"'root' in parents and title='{path_name}' and \
-                                            trashed=false"}).GetList()
+        _debug("Compound path detected (%s)", path)
+        # Start walking from the deepest parent directory that has already been resolved (if any)
+        start_level, parent_id = _get_longest_cached_prefix(drive, tree)
+
+        # If there are several levels left, then get all their candidates at once instead of one request per level
+        # (if there are too many candidates, then no candidates are returned)
+        candidates = _get_drive_path_candidates(drive, tree[start_level:]) if len(tree) - start_level > 1 else None
+
+        for level in range(start_level, len(tree)):
+            if candidates is not None:
+                drive_objects = candidates.get((parent_id, tree[level]), [])
             else:
-                # If no data was obtained in the previous iteration, then return empty to indicate that no data exists.
-                if len(drive_objects) == 0:
-                    _debug(f"{path_name} was not found in drive")
-                    return []
+                drive_object = _first_match(drive, _q_children_of(parent_id, tree[level]))
+                drive_objects = [] if drive_object is None else [drive_object]
+
+            # If no data was obtained, then return empty to indicate that no data exists.
+            if len(drive_objects) == 0:
+                _debug("%s was not found in drive", tree[level])
+                return []
+
+            parent_id = drive_objects[0]['id']
+            _get_path_cache(drive)['/'.join(tree[:level + 1])] = drive_objects[0]
 
-                drive_objects = drive.ListFile({'q': f"'{drive_objects[0]['id']}' in parents and title='{path_name}' \
-                                             and trashed=false"}).GetList()
     return drive_objects
 
 
-def _path_exist_in_drive(drive, path):
-    """Check if the specified path exist in Google Drive.
+def _resolve_drive_path(drive, path):
+    """Get the Google Drive object of the specified path. This is also used to check if the path exists.
 
     Args:
         drive (pydrive.drive.GoogleDrive): Google Drive instance object.
-        path (str): Google drive path to check.
+        path (str): Google drive path to resolve.
 
     Returns:
-        boolean: True if exists, False otherwhise.
+        GoogleDriveFile: Object data (only the 'id', 'title' and 'mimeType' fields for the root directory), or None if
+                         the path does not exist in Google Drive.
     """
-    _debug(f"Checking if '{path}' path exists in drive")
-    exist = len(_get_drive_object(drive, path)) > 0
-    _debug(f"'{path}' path {'exists' if exist else 'does not exist'} in drive")
+    if _norm_path(path) == ():
+        return _ROOT_DRIVE_OBJECT
 
-    return exist
+    drive_objects = _get_drive_object(drive, path)
+    _debug("'%s' path %s in drive", path, 'exists' if len(drive_objects) > 0 else 'does not exist')
+
+    return drive_objects[0] if len(drive_objects) > 0 else None
 
 
 def _create_drive_path(drive, path):
@@ -258,25 +466,371 @@ def _create_drive_path(drive, path):
         drive (pydrive.drive.GoogleDrive): Google Drive instance object.
         path (str): Google drive path to create.
     """
-    if not _path_exist_in_drive(drive, path):
-        _debug(f"Creating '{path}' path in drive")
-        path = path[1:] if path and path[0] == '/' else path  # Clean initial /
-        tree = path.split('/')
-        drive_objects = _get_drive_object(drive, path='/')
-        path_built = ''
+    tree = _norm_path(path)
+    path = '/'.join(tree)
+
+    # The existence check walk caches all the existing parent directories, so they do not need to be looked up again
+    if path != '' and _resolve_drive_path(drive, path) is None:
+        _debug("Creating '%s' path in drive", path)
+        existing_levels, parent_id = _get_longest_cached_prefix(drive, tree)
+
+        # Create only the missing levels. Each new directory is the parent of the next one (no extra lookups)
+        for level in range(existing_levels + 1, len(tree) + 1):
+            parent_id = _create_drive_dir(drive, '/'.join(tree[:level]), parent_id)['id']
+
+        _debug("'%s' path has been created in drive", path)
+
+
+def _get_drive_parent_id(drive, path):
+    """Get the id of the Google Drive directory that contains the specified path.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        path (str): Google Drive path whose parent directory id will be obtained.
+
+    Returns:
+        str: Parent directory id ('root' if the object is located in the root directory).
+    """
+    return _resolve_drive_path(drive, os.path.dirname(path))['id']
+
+
+def _create_drive_dir(drive, path, parent_id):
+    """Create a single Google Drive directory.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        path (str): Google Drive path of the directory to create.
+        parent_id (str): Google Drive id of the parent directory.
+
+    Returns:
+        GoogleDriveFile: Created directory data.
+    """
+    _debug("Creating '%s' directory in drive", path)
+    folder = drive.CreateFile({'parents': [{'id': parent_id}], 'title': os.path.basename(path),
+                               'mimeType': _FOLDER_MIME_TYPE})
+    _retry(folder.Upload)
+    _get_path_cache(drive)['/'.join(_norm_path(path))] = folder
+
+    return folder
+
+
+def _plan_upload(local_path, drive_path):
+    """Get the Google Drive directories and files needed to upload a local directory (recursive).
+
+    The local tree is walked once (breadth-first), so parent directories are always listed before their subdirectories.
+    The directory entries already know their type, so no extra stat calls are needed for the files. Symbolic links
+    are followed, but each directory is only walked once (to avoid symbolic link loops). Entries that are neither a file
+    nor a directory (e.g. broken symbolic links) are skipped.
+
+    Args:
+        local_path (str): Local directory path to upload.
+        drive_path (str): Google Drive path where the directory will be uploaded.
+
+    Returns:
+        tuple(list(str), list(tuple(str, str))): Google Drive directory paths to create (`drive_path` first), and the
+                                                 local and Google Drive path of each file to upload.
+    """
+    drive_dirs = []
+    files = []
+    pending_dirs = deque([(local_path, drive_path)])
+    local_stat = os.stat(local_path)
+    visited_dirs = {(local_stat.st_dev, local_stat.st_ino)}  # Walked directories, identified by (device, inode)
+
+    while len(pending_dirs) > 0:
+        dir_path, drive_dir = pending_dirs.popleft()
+        drive_dirs.append(drive_dir)
+
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir():
+                    dir_stat = dir_entry.stat()
+
+                    if (dir_stat.st_dev, dir_stat.st_ino) in visited_dirs:
+                        _info("Skipping '%s' local directory, it is already included in the upload",
+                              dir_entry.path)
+                        continue
+
+                    visited_dirs.add((dir_stat.st_dev, dir_stat.st_ino))
+                    pending_dirs.append((dir_entry.path, f"{drive_dir}/{dir_entry.name}"))
+                elif dir_entry.is_file():
+                    files.append((dir_entry.path, f"{drive_dir}/{dir_entry.name}"))
+                else:
+                    _info("Skipping '%s' local path, it is not a file or directory", dir_entry.path)
+
+    return drive_dirs, files
+
+
+def _upload_drive_file(drive, local_path, drive_path):
+    """Upload a single local file to Google Drive. The parent directory must already exist.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        local_path (str): Local file path to upload.
+        drive_path (str): Google Drive path where the file will be uploaded.
+    """
+    _info("Uploading '%s' from local path to %s in drive", local_path, drive_path)
+    metadata = {'parents': [{'id': _get_drive_parent_id(drive, drive_path)}], 'title': os.path.basename(drive_path)}
+    mime_type = mimetypes.guess_type(local_path)[0] or 'application/octet-stream'
+    response = None
+
+    # The file is streamed from its handle, reading a single chunk at a time, and closed as soon as it is uploaded
+    with open(local_path, 'rb') as local_file:
+        media = MediaIoBaseUpload(local_file, mime_type, chunksize=_MEDIA_CHUNK_SIZE, resumable=True)
+        request = _get_drive_service(drive).files().insert(body=metadata, media_body=media, fields=_FILE_FIELDS)
+        request.http = drive.auth.Get_Http_Object()  # The service connection can not be shared between threads
+
+        # If a chunk fails, then the upload is resumed from the last byte received by Drive
+        while response is None:
+            _, response = _retry(request.next_chunk)
+
+    _get_path_cache(drive)['/'.join(_norm_path(drive_path))] = drive.CreateFile(response)
+
+
+def _get_drive_children(drive, folder_ids, folders_only=False):
+    """Get the content of several Google Drive directories with a single request.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        folder_ids (list(str)): Google Drive directory ids (up to 50). The root directory can be set as 'root'.
+        folders_only (boolean): True to get only the subdirectories, False to get all the objects.
+
+    Returns:
+        dict: Objects contained in each directory (list(GoogleDriveFile)), indexed by the directory id.
+    """
+    parents_query = ' or '.join(_Q_PARENT.format(parent=_esc(folder_id)) for folder_id in folder_ids)
+    query = f"({parents_query}) and {_Q_FOLDER} and trashed=false" if folders_only else \
+        f"({parents_query}) and trashed=false"
+    children = {folder_id: [] for folder_id in folder_ids}
+
+    for item in _iter_drive_objects(drive, query):
+        # Objects with several parents are only assigned to the first requested one
+        for parent in item['parents']:
+            parent_id = 'root' if parent.get('isRoot') and 'root' in children else parent['id']
+
+            if parent_id in children:
+                children[parent_id].append(item)
+                break
+
+    return children
+
+
+def _plan_download(drive, folder_id, drive_path, local_path, max_workers=4):
+    """Get the local directories and files needed to download a Google Drive directory (recursive).
+
+    The whole directory content is listed at once, and parent directories are always listed before their content.
+    Google Drive allows several objects with the same title in a directory. Directories with the same path are merged,
+    and only the first file of each local path is downloaded (the rest are skipped), so that no local file is written
+    twice at the same time. Objects whose title can not be used as a local name (e.g. '..' or titles with path
+    separators), and the content of such directories, are skipped too, so nothing is written outside `local_path`.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        folder_id (str): Google Drive directory id.
+        drive_path (str): Google Drive directory path.
+        local_path (str): Local path where the directory will be downloaded.
+        max_workers (int): Maximum number of listing requests to make at the same time.
+
+    Returns:
+        tuple(list(str), list(tuple(str, str, str))): Local directory paths to create (`local_path` first), and the
+                                                      Google Drive id, Google Drive path and local path of each file
+                                                      to download.
+    """
+    local_dirs = [local_path]
+    files = []
+    used_paths = set()
+    real_local_path = os.path.realpath(local_path)
+    tree_objects = []
+    skipped_dirs = []  # Relative paths of the skipped directories, whose content is skipped too
+
+    for object_path, _object in list_drive_tree(drive, folder_id, max_workers=max_workers):
+        if any(object_path.startswith(f"{skipped_dir}/") for skipped_dir in skipped_dirs):
+            continue
+
+        local_object_path = os.path.realpath(f"{local_path}/{object_path}")
+
+        if not _is_local_name(_object['title']) or not local_object_path.startswith(real_local_path + os.sep):
+            _error("Skipping '%s/%s' drive object, its title is not a valid local name", drive_path, object_path)
+
+            if _is_drive_dir(_object):
+                skipped_dirs.append(object_path)
+            continue
+
+        tree_objects.append((object_path, _object))
+
+    # Directories first (keeping the tree order), so that a file can not take the local path of a directory
+    for object_path, _object in tree_objects:
+        if _is_drive_dir(_object) and f"{local_path}/{object_path}" not in used_paths:
+            used_paths.add(f"{local_path}/{object_path}")
+            local_dirs.append(f"{local_path}/{object_path}")
+
+    for object_path, _object in tree_objects:
+        if _is_drive_dir(_object):
+            continue
+
+        local_file_path = f"{local_path}/{object_path}"
+
+        if local_file_path in used_paths:
+            _error("Skipping '%s/%s' drive file, its '%s' local path is duplicated", drive_path, object_path,
+                   local_file_path)
+            continue
+
+        used_paths.add(local_file_path)
+        files.append((_object['id'], f"{drive_path}/{object_path}", local_file_path))
+
+    return local_dirs, files
+
+
+def _is_local_name(title):
+    """Check if a Google Drive object title can be used as a single local file or directory name.
+
+    Args:
+        title (str): Google Drive object title.
+
+    Returns:
+        boolean: True if the title is a valid local name, False otherwise (empty, '.', '..' or with path separators).
+    """
+    return title not in ('', '.', '..') and '/' not in title and '\\' not in title
+
+
+def _download_drive_file(drive, file_id, drive_path, local_path):
+    """Download a single Google Drive file to the specified local path.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        file_id (str): Google Drive file id.
+        drive_path (str): Google Drive file path.
+        local_path (str): Local path where locate the downloaded file.
+    """
+    _info("Downloading '%s' from drive to '%s' local path", drive_path, local_path)
+    request = _get_drive_service(drive).files().get_media(fileId=file_id)
+    request.http = drive.auth.Get_Http_Object()  # The service connection can not be shared between threads
 
-        for path_name in tree:
-            # If the path name is not contained in the current path, then create it
-            if path_name not in [item['title'] for item in drive_objects]:
-                path_id = 'root' if path_built == '' else _get_drive_object(drive, path_built)[0]['id']
-                folder = drive.CreateFile({'parents': [{'id': path_id}], 'title': path_name,
-                                           'mimeType': 'application/vnd.google-apps.folder'})
-                folder.Upload()
+    # Create dirname path if it does not exist
+    _create_local_path(os.path.dirname(local_path) or '.')
 
-            path_built += f"/{path_name}"
-            drive_objects = get_drive_objects(drive, path_built)
+    # The file is written in chunks straight to its destination path. A failed chunk is requested again. The file is
+    # opened outside the try block, so that only a file that has actually been created is removed on errors
+    local_file = open(local_path, 'wb')
 
-        _debug(f"'{path}' path has been created in drive")
+    try:
+        with local_file:
+            downloader = MediaIoBaseDownload(local_file, request, chunksize=_MEDIA_CHUNK_SIZE)
+            done = False
+
+            while not done:
+                _, done = _retry(downloader.next_chunk)
+    except Exception:
+        os.remove(local_path)  # Do not leave partially downloaded files
+        raise
+
+
+def _retry(function, *args, retries=6, base=0.5, **kwargs):
+    """Call a Google Drive API function, retrying it with exponential backoff (plus a random jitter) if the request
+    fails due to a temporary error (rate limit exceeded or server error).
+
+    Args:
+        function (callable): Function to call.
+        args (list): Function positional arguments.
+        retries (int): Maximum number of retries.
+        base (float): Seconds to wait before the first retry. The waiting time is doubled on each retry.
+        kwargs (dict): Function keyword arguments.
+
+    Returns:
+        object: Function result.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return function(*args, **kwargs)
+        except (ApiRequestError, HttpError) as error:
+            # PyDrive wraps the API errors. Errors without an HTTP response are not retried
+            http_error = error.args[0] if isinstance(error, ApiRequestError) and error.args else error
+            response = getattr(http_error, 'resp', None)
+
+            if response is None:
+                temporary_error = False
+            elif int(response.status) == 403:
+                # Drive also uses 403 for the rate limit errors, which can be told apart by their reason
+                temporary_error = b'ratelimitexceeded' in getattr(http_error, 'content', b'').lower()
+            else:
+                temporary_error = int(response.status) in _RETRY_STATUSES
+
+            if attempt == retries or not temporary_error:
+                raise
+
+            wait = base * 2 ** attempt + random.uniform(0, 0.1)
+            _debug("Drive request failed (%s). Retrying in %.2f seconds", error, wait)
+            time.sleep(wait)
+
+
+def _iter_drive_objects(drive, query, page_size=1000):
+    """Iterate over the Google Drive objects that match a query. The results are requested lazily, one page at a time,
+    retrying each page request on temporary errors.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        query (str): Google Drive query.
+        page_size (int): Maximum number of objects requested at a time.
+
+    Yields:
+        GoogleDriveFile: Google Drive object.
+    """
+    file_list = drive.ListFile({'q': query, 'fields': _LIST_FIELDS, 'maxResults': page_size})
+
+    while True:
+        # A failed request does not update the pagination state, so the same page is requested again on each attempt
+        page = _retry(next, file_list, None)
+
+        if page is None:
+            return
+
+        yield from page
+
+
+def _list_drive_objects(drive, query):
+    """Get all the Google Drive objects that match a query.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        query (str): Google Drive query.
+
+    Returns:
+        list(GoogleDriveFile): Google Drive object list.
+    """
+    return list(_iter_drive_objects(drive, query))
+
+
+def _first_match(drive, query):
+    """Get the first Google Drive object that matches a query. Only a single object is requested.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        query (str): Google Drive query.
+
+    Returns:
+        GoogleDriveFile: Google Drive object data, or None if no object matches the query.
+    """
+    return next(_iter_drive_objects(drive, query, page_size=1), None)
+
+
+def _classify_local_path(local_path):
+    """Get the type of a local path with a single stat call.
+
+    Args:
+        local_path (str): Local path to classify.
+
+    Returns:
+        tuple(str, os.stat_result): Path type ('file', 'dir', 'other' or 'missing') and its stat data (None if the
+                                    path does not exist).
+    """
+    try:
+        path_stat = os.stat(local_path)
+    except OSError:
+        return 'missing', None
+
+    if stat.S_ISREG(path_stat.st_mode):
+        return 'file', path_stat
+
+    return ('dir' if stat.S_ISDIR(path_stat.st_mode) else 'other'), path_stat
 
 
 def _create_local_path(local_path):
@@ -285,8 +839,8 @@ def _create_local_path(local_path):
     Args:
         local_path (str): Local path to create.
     """
-    if not os.path.exists(local_path):
-        _debug(f"Creating '{local_path}' path in local")
+    if _classify_local_path(local_path)[0] == 'missing':
+        _debug("Creating '%s' path in local", local_path)
         os.makedirs(local_path)
 
 
@@ -298,21 +852,37 @@ def _process_request(drive, input_parameters):
         input_parameters (argparse.Namespace): Input parameters.
     """
     if input_parameters.list is not None:
-        if not _path_exist_in_drive(drive, input_parameters.list):
-            _error(f"The '{input_parameters.list}' path does not exist in Google Drive")
+        if _resolve_drive_path(drive, input_parameters.list) is None:
+            _error("The '%s' path does not exist in Google Drive", input_parameters.list)
             sys.exit(1)
         drive_file_names = get_drive_object_names(drive, input_parameters.list)
-        _info(f"Drive files on path '{input_parameters.list}' = {drive_file_names}")
+        _info("Drive files on path '%s' = %s", input_parameters.list, drive_file_names)
     elif input_parameters.upload is not None:
-        upload_objects_to_drive(drive, input_parameters.upload[0], input_parameters.upload[1])
+        upload_objects_to_drive(drive, input_parameters.upload[0], input_parameters.upload[1],
+                                max_workers=input_parameters.parallel)
     elif input_parameters.download is not None:
-        download_drive_objects(drive, input_parameters.download[0], input_parameters.download[1])
+        download_drive_objects(drive, input_parameters.download[0], input_parameters.download[1],
+                               max_workers=input_parameters.parallel)
     elif input_parameters.remove is not None:
         remove_drive_objects(drive, input_parameters.remove)
 
 # -------------------------------------------  PUBLIC FUNCTIONS  -------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def get_drive(credentials_file=DEFAULT_USER_CREDENTIALS_FILE):
+    """Get the Google Drive instance object. It is created (and authenticated) only once per process, so that it can be
+    reused by all the calls made when the app is used as a library.
+
+    Args:
+        credentials_file (str): Path where the credential file is located.
+
+    Returns:
+        pydrive.drive.GoogleDrive: Google Drive instance object.
+    """
+    return GoogleDrive(_drive_authentication(credentials_file))
+
+
 def get_drive_objects(drive, path):
     """Get all the Google Drive objects from the specified path.
 
@@ -323,25 +893,90 @@ def get_drive_objects(drive, path):
     Returns:
         list(GoogleDriveFile): Google Drive object list.
     """
-    _debug(f"Getting files and directories from '{path}' path")
-
-    # If root path, then the called function will return all the root objects
-    if path == '/':
-        return _get_drive_object(drive, path)
-
-    # Get the drive object data
-    drive_object = _get_drive_object(drive, path)
-    drive_objects = drive_object
+    _debug("Getting files and directories from '%s' path", path)
+    drive_object = _resolve_drive_path(drive, path)
 
     # If Google Drive specified path does not exist
-    if len(drive_objects) == 0:
+    if drive_object is None:
         return []
 
-    # If directory, then go inside and get the information of its content
-    if _is_drive_dir(drive_objects[0]):
-        drive_objects = drive.ListFile({'q': f"'{drive_objects[0]['id']}' in parents and trashed=false"}).GetList()
+    # If directory (root included), then get the information of its content with a single listing
+    if _is_drive_dir(drive_object):
+        return _list_drive_objects(drive, _q_children_of(drive_object['id']))
+
+    return [drive_object]
+
+
+def list_drive_tree(drive, folder_id, max_workers=4, folders_only=False, depth=None):
+    """Get all the Google Drive objects contained in a directory and its subdirectories (recursive).
+
+    The tree is walked level by level, listing the content of up to 50 directories with each request. The requests
+    of the same level are made in parallel, using up to `max_workers` threads.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        folder_id (str): Google Drive directory id ('root' for the root directory).
+        max_workers (int): Maximum number of listing requests to make at the same time.
+        folders_only (boolean): True to get only the subdirectories, False to get all the objects.
+        depth (int): Maximum number of levels to walk. None to walk the whole tree.
+
+    Returns:
+        list(tuple(str, GoogleDriveFile)): Path (relative to the directory) and data of each object. Directories are
+                                           always listed before their content.
+    """
+    _debug("Listing the '%s' directory tree", folder_id)
+    tree_objects = []
+    level_dirs = {folder_id: ''}  # Directory id -> relative path
+    level = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while len(level_dirs) > 0 and (depth is None or level < depth):
+            dir_ids = list(level_dirs)
+            dir_id_chunks = [dir_ids[index:index + _MAX_QUERY_PARENTS]
+                             for index in range(0, len(dir_ids), _MAX_QUERY_PARENTS)]
+            next_level_dirs = {}
+
+            for children in executor.map(lambda chunk: _get_drive_children(drive, chunk, folders_only),
+                                         dir_id_chunks):
+                for parent_id, drive_objects in children.items():
+                    for _object in drive_objects:
+                        parent_path = level_dirs[parent_id]
+                        object_path = f"{parent_path}/{_object['title']}" if parent_path else _object['title']
+                        tree_objects.append((object_path, _object))
+
+                        if _is_drive_dir(_object):
+                            next_level_dirs[_object['id']] = object_path
+
+            level_dirs = next_level_dirs
+            level += 1
+
+    return tree_objects
 
-    return drive_objects
+
+def bootstrap_tree(drive, path='/', depth=None):
+    """Load the directories tree of a Google Drive path into the paths cache, so that the subsequent lookups of those
+    directories (and of the files they contain) do not need to walk the tree from the root.
+
+    Args:
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object.
+        path (str): Google Drive directory path whose tree will be loaded.
+        depth (int): Maximum number of levels to load. None to load the whole tree.
+    """
+    _debug("Loading the '%s' directories tree", path)
+    path = '/'.join(_norm_path(path))
+
+    drive_object = _resolve_drive_path(drive, path)
+
+    if drive_object is None or not _is_drive_dir(drive_object):
+        _error("The '%s' directory does not exist in Google Drive", path)
+        return
+
+    path_cache = _get_path_cache(drive)
+
+    for folder_path, folder in list_drive_tree(drive, drive_object['id'], folders_only=True, depth=depth):
+        path_cache.setdefault(f"{path}/{folder_path}" if path else folder_path, folder)
+
+    _debug("The '%s' directories tree has been loaded", path)
 
 
 def get_drive_object_names(drive, path):
@@ -357,104 +992,99 @@ def get_drive_object_names(drive, path):
     return [file_name['title'] for file_name in get_drive_objects(drive, path)]
 
 
-def upload_objects_to_drive(drive, local_path, drive_path, create_directories=True):
+def upload_objects_to_drive(drive, local_path, drive_path, *, max_workers=8):
     """Upload a file or local directory with all its contents (recursive) to Google Drive.
 
+    The whole directories tree is created first, and then all the files are uploaded in parallel, using up to
+    `max_workers` threads.
+
     Args:
         drive (pydrive.drive.GoogleDrive): Google Drive instance object.
         local_path (str): Local path to upload to Google Drive.
         drive_path (str): Google Drive path where the file or directory will be uploaded.
-        create_directories (boolean): True to check if it is needed to create directories, False otherwise.
+        max_workers (int): Maximum number of files to upload at the same time.
     """
-    _info(f"Uploading '{local_path}' from local path to {drive_path} in drive")
+    # A single stat call is used to check if the local path exists and to get its type
+    local_path_type, _ = _classify_local_path(local_path)
 
-    if not os.path.exists(local_path):
-        _error(f"'{local_path}' local path does not exists")
+    if local_path_type == 'missing':
+        _error("'%s' local path does not exists", local_path)
         sys.exit(1)
 
-    if _path_exist_in_drive(drive, drive_path):
-        _error(f"'{drive_path}' path already exists on drive")
+    if _resolve_drive_path(drive, drive_path) is not None:
+        _error("'%s' path already exists on drive", drive_path)
         sys.exit(1)
 
-    base_name = os.path.basename(drive_path)
-    path_name = os.path.dirname(drive_path)
-
-    if os.path.isfile(local_path):
-        if create_directories:
-            _create_drive_path(drive, path_name)  # Create drive path if not exist (check is made inside the function)
-
-        path_id = _get_drive_object(drive, path_name)[0]['id']
-
-        file = drive.CreateFile({'parents': [{'id': path_id}], 'title': base_name})
-        file.SetContentFile(local_path)
-        file.Upload()
-
-    elif os.path.isdir(local_path):
-        _create_drive_path(drive, drive_path)  # Create drive path if not exist (check is made inside the function)
-        path_id = _get_drive_object(drive, path_name)[0]['id']
-
-        for item in os.listdir(local_path):
-            item_path = f"{local_path}/{item}"
-            # Recursive calls to create and copy the files tree
-            if os.path.isfile(item_path):
-                # Avoid check drive directories, because all these elements have the same
-                # parent folder, and it is already created (lightweight calls).
-                upload_objects_to_drive(drive, item_path, f"{drive_path}/{item}", False)
-            elif os.path.isdir(item_path):
-                upload_objects_to_drive(drive, item_path, f"{drive_path}/{item}")
+    if local_path_type in ('file', 'dir'):
+        # Create the parent drive path if not exist (check is made inside the function). The upload path itself is
+        # already known to be missing, so it does not need to be checked again
+        _create_drive_path(drive, os.path.dirname(drive_path))
+
+    if local_path_type == 'file':
+        _upload_drive_file(drive, local_path, drive_path)
+
+    elif local_path_type == 'dir':
+        _info("Uploading '%s' from local path to %s in drive", local_path, drive_path)
+        drive_dirs, files = _plan_upload(local_path, drive_path)
+
+        # Create the whole directories tree (parents first) in a single pass. The parent ids are taken from the paths
+        # cache, where each directory is stored as soon as it is created
+        for drive_dir in drive_dirs:
+            _create_drive_dir(drive, drive_dir, _get_drive_parent_id(drive, drive_dir))
+
+        # Upload all the files at the same time
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_upload_drive_file, drive, file_path, drive_file_path)
+                       for file_path, drive_file_path in files]
+            for future in futures:
+                future.result()  # Raise the upload errors (if any)
     else:
-        _error(f"Local path {local_path} is not detected as file or directory")
+        _error("Local path %s is not detected as file or directory", local_path)
         sys.exit(1)
 
 
-def download_drive_objects(drive, drive_path, local_path, check_remote_exist=True):
+def download_drive_objects(drive, drive_path, local_path, *, max_workers=8):
     """Download a Google Drive file or directory (with all its content) to the specified local path.
 
+    The directory tree is listed and its files are downloaded in parallel, using up to `max_workers` threads.
+
     Args:
         drive (pydrive.drive.GoogleDrive): Google Drive instance object.
         drive_path (str): Google Drive path where the file or directory will be downloaded.
         local_path (str): Local path where locate the downloaded files.
-        check_remote_exist (boolean): True to check if drive path exists, False otherwise.
+        max_workers (int): Maximum number of requests (listings or files) to make at the same time.
     """
     # Set the current working directory if selected the '.' or './' characters
     local_path = f"{os.getcwd()}/{os.path.basename(drive_path)}" if local_path == '.' or local_path == './' else \
         local_path
 
-    if os.path.exists(local_path):
-        _error(f"The '{local_path}' local path already exists")
+    if _classify_local_path(local_path)[0] != 'missing':
+        _error("The '%s' local path already exists", local_path)
         sys.exit(1)
 
-    # Necessary to check only the first time, because in recursive calls we know that it will exist.
-    if check_remote_exist:
-        if not _path_exist_in_drive(drive, drive_path):
-            _error(f"The '{drive_path}' path does not exist in Google Drive")
-            sys.exit(1)
-
-    _info(f"Downloading '{drive_path}' from drive to '{local_path}' local path")
+    # The same lookup is used to check that the path exists and to get its data
+    drive_object = _resolve_drive_path(drive, drive_path)
 
-    drive_object = _get_drive_object(drive, drive_path)[0]
+    if drive_object is None:
+        _error("The '%s' path does not exist in Google Drive", drive_path)
+        sys.exit(1)
 
     if _is_drive_dir(drive_object):
-        _create_local_path(local_path)
-        drive_objects = get_drive_objects(drive, drive_path)
-
-        for _object in drive_objects:
-            if _is_drive_dir(_object):
-                download_drive_objects(drive, f"{drive_path}/{_object['title']}", f"{local_path}/{_object['title']}",
-                                       False)
-            else:
-                download_drive_objects(drive, f"{drive_path}/{_object['title']}", f"{local_path}/{_object['title']}",
-                                       False)
+        _info("Downloading '%s' from drive to '%s' local path", drive_path, local_path)
+        local_dirs, files = _plan_download(drive, drive_object['id'], drive_path, local_path, max_workers)
+
+        # Create the whole local directories tree
+        for local_dir in local_dirs:
+            _create_local_path(local_dir)
+
+        # Download all the files at the same time
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_download_drive_file, drive, file_id, drive_file_path, local_file_path)
+                       for file_id, drive_file_path, local_file_path in files]
+            for future in futures:
+                future.result()  # Raise the download errors (if any)
     else:
-        file_base_name = os.path.basename(drive_path)
-        file = drive.CreateFile({'id': drive_object['id']})
-        file.GetContentFile(file_base_name)
-
-        # Create dirname path if it does not exist
-        _create_local_path(os.path.dirname(local_path))
-
-        # Move the downloaded file to its destination path
-        shutil.move(file_base_name, local_path)
+        _download_drive_file(drive, drive_object['id'], drive_path, local_path)
 
 
 def remove_drive_objects(drive, drive_path, trash=True):
@@ -466,16 +1096,48 @@ def remove_drive_objects(drive, drive_path, trash=True):
         trash (boolean): True if the removed file or directory will be sent to the trash, False to remove it
                          permanently.
     """
-    if _path_exist_in_drive(drive, drive_path):
-        object_id = _get_drive_object(drive, drive_path)[0]['id']
-        _object = drive.CreateFile({'id': object_id})
+    # The root directory is the whole Google Drive, so it can not be removed
+    if _norm_path(drive_path) == ():
+        _error("The '%s' root directory can not be removed from drive", drive_path)
+        sys.exit(1)
+
+    drive_object = _resolve_drive_path(drive, drive_path)
+
+    if drive_object is not None:
+        _object = drive.CreateFile({'id': drive_object['id']})
 
-        _info(f"Removing '{drive_path}' from drive")
+        _info("Removing '%s' from drive", drive_path)
 
         # Remove the parent object
-        _object.Trash() if trash else _object.Delete()
+        _retry(_object.Trash if trash else _object.Delete)
+
+        # Remove the object and its content from the paths cache
+        clear_path_cache(drive_path, drive)
     else:
-        _error(f"Could not remove the '{drive_path}' from drive, it does not exist")
+        _error("Could not remove the '%s' from drive, it does not exist", drive_path)
+
+
+def clear_path_cache(drive_path=None, drive=None):
+    """Remove the resolved Google Drive paths from the cache.
+
+    Args:
+        drive_path (str): Google Drive path to remove from the cache (with all its content). None to clear the whole
+                          cache.
+        drive (pydrive.drive.GoogleDrive): Google Drive instance object whose cache will be cleared. None to clear the
+                                           cache of all the instances.
+    """
+    with _PATH_CACHES_LOCK:
+        path_caches = list(_PATH_CACHES.values()) if drive is None else [_PATH_CACHES.setdefault(drive.auth, {})]
+
+    for path_cache in path_caches:
+        if drive_path is None:
+            path_cache.clear()
+            continue
+
+        cached_path = '/'.join(_norm_path(drive_path))
+
+        for path in [path for path in path_cache if path == cached_path or path.startswith(f"{cached_path}/")]:
+            del path_cache[path]
 
 
 # -------------------------------------------------  MAIN  -------------------------------------------------------------
@@ -483,16 +1145,14 @@ def remove_drive_objects(drive, drive_path, trash=True):
 
 def main():
     """Main process:
-        - Get the input parameters.
-        - Validate parameters.
+        - Get the input parameters (exactly one action is required).
         - Check credentials file.
         - Authenticate the request and process it.
     """
     input_parameters = _get_parameters()
     _set_logging(input_parameters.debug)
-    _validate_parameters(input_parameters)
     _check_credentials_file()
-    drive = GoogleDrive(_drive_authentication())
+    drive = get_drive()
     _process_request(drive, input_parameters)
 
 